@@ -37,11 +37,13 @@ setup(
         "tensorflow-macos>=2.14.0;platform_machine == 'arm64' and platform_system == 'Darwin'",
         "keras==2.14.0",
         "polars==1.2.1",
+        "numba>=0.59.0",
     ],
     extras_require={
         "test": [
             "pytest==8.2.2",
             "black[jupyter]==24.4.2",
+            "zstandard",
         ]
     },
 )
@@ -15,11 +15,12 @@ from unravel.utils import (
 )
 
 from kloppy import skillcorner, sportec
-from kloppy.domain import Ground, TrackingDataset, Orientation
+from kloppy.domain import Ground, TrackingDataset, Orientation, MetricPitchDimensions
 from typing import List, Dict
 
 from spektral.data import Graph
 
+import pickle
 import pytest
 
 import numpy as np
@@ -452,8 +453,211 @@ class TestKloppyPolarsData:
         data = spektral_graphs
         assert len(data) == 384
         assert isinstance(data[0], Graph)
+        assert all(g.x.shape == (23, 15) for g in data)
+        assert data[0].x.dtype == np.float32
+        assert data[0].e.dtype == np.float32
+        assert data[0].a.dtype == np.int8
 
-    def test_to_spektral_graph(
+        counts = spc_padding.dataset.group_by(Group.BY_FRAME).agg(pl.len())
+        assert (counts["len"] == 23).all()
+
+    def test_padding_batch_matches_per_frame(
+        self, spc_padding: SoccerGraphConverterPolars
+    ):
+        batched = spc_padding._convert()
+
+        # the padded rows are already in the dataset, without pad the same frames go through the per frame path
+        spc_padding.pad = False
+        per_frame = spc_padding._convert()
+
+        assert len(batched) == 384
+        assert batched.equals(per_frame)
+
+    def test_graphs_per_frame(
+        self, soccer_polars_converter: SoccerGraphConverterPolars
+    ):
+        data = soccer_polars_converter.to_spektral_graphs()
+
+        assert data[0].id == "2417-1529"
+        assert data[1].id == "2417-1530"
+
+        frame = soccer_polars_converter.dataset.filter(
+            pl.col("graph_id") == "2417-1530"
+        )
+        assert data[1].x.shape[0] == len(frame)
+        assert not np.allclose(data[0].x[:, 0], data[1].x[:, 0])
+        assert "__is_gk" not in soccer_polars_converter.dataset.columns
+
+    @pytest.mark.parametrize("pad", [True, False])
+    def test_prediction(self, kloppy_polars_dataset: KloppyPolarsDataset, pad: bool):
+        kloppy_polars_dataset.data = kloppy_polars_dataset.data.drop(
+            kloppy_polars_dataset._label_column
+        )
+        converter = SoccerGraphConverterPolars(
+            dataset=kloppy_polars_dataset, prediction=True, pad=pad
+        )
+        data = converter.to_spektral_graphs()
+
+        assert len(data) == 384
+        assert np.isnan(data[0].y[0])
+
+    @pytest.mark.parametrize("pad", [True, False])
+    def test_no_complete_frames(
+        self, kloppy_polars_dataset: KloppyPolarsDataset, pad: bool
+    ):
+        kloppy_polars_dataset.data = kloppy_polars_dataset.data.filter(
+            pl.col(Column.TEAM_ID) != Constant.BALL
+        )
+        converter = SoccerGraphConverterPolars(dataset=kloppy_polars_dataset, pad=pad)
+
+        assert converter.to_spektral_graphs() == []
+
+    def test_pitch_dimensions_without_length(
+        self, kloppy_polars_dataset: KloppyPolarsDataset
+    ):
+        pitch_dimensions = kloppy_polars_dataset.settings.pitch_dimensions
+        kloppy_polars_dataset.settings.pitch_dimensions = MetricPitchDimensions(
+            x_dim=pitch_dimensions.x_dim,
+            y_dim=pitch_dimensions.y_dim,
+            standardized=False,
+        )
+
+        with pytest.raises(
+            ValueError,
+            match="pitch_dimensions should have a pitch_length and pitch_width...",
+        ):
+            SoccerGraphConverterPolars(dataset=kloppy_polars_dataset)
+
+    def test_integer_graph_ids(self, kloppy_polars_dataset: KloppyPolarsDataset):
+        converter = SoccerGraphConverterPolars(
+            dataset=kloppy_polars_dataset, graph_id_col=Column.FRAME_ID, pad=False
+        )
+        data = converter.to_spektral_graphs()
+
+        assert data[0].id == "1529"
+
+    @pytest.mark.parametrize("random_seed", [False, 42])
+    def test_frame_order_interleaved_games(
+        self, kloppy_polars_dataset: KloppyPolarsDataset, random_seed
+    ):
+        df = kloppy_polars_dataset.data
+        other_game = df.with_columns(
+            (pl.col(Column.GAME_ID).cast(pl.String) + "0").cast(
+                df.schema[Column.GAME_ID]
+            )
+        )
+        kloppy_polars_dataset.data = pl.concat([df, other_game]).sort(
+            Column.FRAME_ID, maintain_order=True
+        )
+        kloppy_polars_dataset.add_graph_ids(by=["game_id", "frame_id"])
+
+        converter = SoccerGraphConverterPolars(
+            dataset=kloppy_polars_dataset, random_seed=random_seed, pad=False
+        )
+        data = converter.to_spektral_graphs()
+
+        # graphs follow the order in which frames first appear in the (shuffled) dataset, not grouped per game
+        expected = (
+            converter.dataset[converter.graph_id_column]
+            .unique(maintain_order=True)
+            .to_list()
+        )
+        assert len(data) == 384 * 2
+        assert [g.id for g in data] == expected
+
+    def test_graph_feature_cols_not_unique(
+        self, kloppy_polars_dataset: KloppyPolarsDataset
+    ):
+        kloppy_polars_dataset.data = kloppy_polars_dataset.data.with_columns(
+            pl.col(Column.X).alias("fake_graph_feature_x")
+        )
+        converter = SoccerGraphConverterPolars(
+            dataset=kloppy_polars_dataset,
+            graph_feature_cols=["fake_graph_feature_x"],
+            pad=False,
+        )
+
+        with pytest.raises(
+            ValueError,
+            match="graph_feature_cols contains multiple different values",
+        ):
+            converter.to_spektral_graphs()
+
+    def test_graph_feature_cols_overlap(
+        self, kloppy_polars_dataset: KloppyPolarsDataset
+    ):
+        converter = SoccerGraphConverterPolars(
+            dataset=kloppy_polars_dataset,
+            graph_feature_cols=[kloppy_polars_dataset._label_column],
+            pad=False,
+        )
+        data = converter.to_spektral_graphs()
+
+        assert len(data) == 384
+        assert data[0].x.shape[1] == 16
+
+    def test_iter_spektral_graphs(
+        self, soccer_polars_converter: SoccerGraphConverterPolars
+    ):
+        graphs = soccer_polars_converter.iter_spektral_graphs()
+        assert isinstance(next(graphs), Graph)
+
+        dataset = soccer_polars_converter.to_custom_dataset()
+        assert isinstance(dataset, CustomSpektralDataset)
+        assert dataset.n_graphs == 384
+        assert dataset[0].id == "2417-1529"
+
+        dataset = CustomSpektralDataset(
+            graphs_iter=soccer_polars_converter.iter_spektral_graphs(),
+            sample_rate=0.5,
+        )
+        assert dataset.n_graphs == 192
+
+    def test_to_pickle(
+        self, soccer_polars_converter: SoccerGraphConverterPolars, tmp_path: Path
+    ):
+        pickle_file = tmp_path / "test_polars.pickle.gz"
+        soccer_polars_converter.to_pickle(str(pickle_file))
+
+        dataset = CustomSpektralDataset(pickle_file=pickle_file)
+        assert dataset.n_graphs == 384
+        assert dataset[0].id == "2417-1529"
+        assert dataset[0].x.shape == (15, 15)
+
+        with pytest.raises(
+            ValueError,
+            match="Only compressed pickle files of type 'some_file_name.pickle.gz' or 'some_file_name.pickle.zst' are supported...",
+        ):
+            soccer_polars_converter.to_pickle(str(tmp_path / "test_polars.pickle"))
+
+    def test_to_pickle_zst(
+        self, soccer_polars_converter: SoccerGraphConverterPolars, tmp_path: Path
+    ):
+        zstandard = pytest.importorskip("zstandard")
+
+        soccer_polars_converter.to_pickle(str(tmp_path / "test_polars.pickle.zst"))
+        soccer_polars_converter.to_pickle(str(tmp_path / "test_polars.pickle.gz"))
+
+        dataset = CustomSpektralDataset(pickle_folder=tmp_path)
+        assert dataset.n_graphs == 384 * 2
+
+        graphs = soccer_polars_converter.to_spektral_graphs()[:2]
+        protocol_0_file = tmp_path / "protocol_0" / "test_polars.pickle.zst"
+        protocol_0_file.parent.mkdir()
+        with zstandard.open(protocol_0_file, "wb") as f:
+            pickle.dump(graphs, f, protocol=0)
+
+        dataset = CustomSpektralDataset(pickle_file=protocol_0_file)
+        assert dataset.n_graphs == 2
+
+    def test_sample_rate(self, soccer_polars_converter: SoccerGraphConverterPolars):
+        graphs = soccer_polars_converter.to_spektral_graphs()
+
+        dataset = CustomSpektralDataset(graphs=graphs, sample_rate=0.5)
+        assert dataset.n_graphs == 192
+        assert dataset[1].id == graphs[2].id
+
+    def test_to_spektral_graph_no_graph_features(
         self, soccer_polars_converter: SoccerGraphConverterPolars
     ):
         """
@@ -471,19 +675,22 @@ class TestKloppyPolarsData:
         x = data[0].x
         n_players = x.shape[0]
         assert x.shape == (n_players, 15)
+        assert x.dtype == np.float32
         print(">>>", x[0, 0])
         assert 0.5475659001711429 == pytest.approx(x[0, 0], abs=1e-5)
-        assert 0.9948105277764999 == pytest.approx(x[0, 4], abs=1e-5)
+        assert 0.8997899683121747 == pytest.approx(x[0, 4], abs=1e-5)
         assert 0.2941671698429814 == pytest.approx(x[8, 2], abs=1e-5)
 
         e = data[0].e
         assert e.shape == (129, 6)
+        assert e.dtype == np.float32
         assert 0.0 == pytest.approx(e[0, 0], abs=1e-5)
         assert 0.5 == pytest.approx(e[0, 4], abs=1e-5)
-        assert 0.7140882876637022 == pytest.approx(e[8, 2], abs=1e-5)
+        assert 0.28591171233629764 == pytest.approx(e[8, 2], abs=1e-5)
 
         a = data[0].a
         assert a.shape == (n_players, n_players)
+        assert a.dtype == np.int8
         assert 1.0 == pytest.approx(a[0, 0], abs=1e-5)
         assert 1.0 == pytest.approx(a[0, 4], abs=1e-5)
         assert 0.0 == pytest.approx(a[8, 2], abs=1e-5)
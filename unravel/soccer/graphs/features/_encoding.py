@@ -0,0 +1,31 @@
+"""
+Integer encodings shared by the Numba kernels (_numba) and the compute_*_pl functions calling them.
+
+The object "role" within a frame is encoded as:
+    ROLE_BALL (0): the ball
+    ROLE_ATTACKING (1): player of the ball owning team
+    ROLE_DEFENDING (2): player of the other team
+"""
+
+import numpy as np
+
+ROLE_BALL = 0
+ROLE_ATTACKING = 1
+ROLE_DEFENDING = 2
+
+ADJACENCY_DENSE = 0
+ADJACENCY_DENSE_AP = 1
+ADJACENCY_DENSE_DP = 2
+ADJACENCY_SPLIT_BY_TEAM = 3
+
+CONNECT_NONE = 0
+CONNECT_BALL = 1
+CONNECT_BALL_CARRIER = 2
+
+
+def encode_roles(team, ball_owning_team, ball_id):
+    return np.where(
+        team == ball_id,
+        ROLE_BALL,
+        np.where(team == ball_owning_team, ROLE_ATTACKING, ROLE_DEFENDING),
+    ).astype(np.int8)
@@ -0,0 +1,417 @@
+"""
+Numba compiled kernels used by the compute_*_pl feature functions.
+
+Every kernel comes in two flavours, one for a single frame (arrays of shape (n_nodes,)) and one for a batch of
+equally sized frames (arrays of shape (n_frames, n_nodes)) that is parallelized over the frames. Both share the same
+per-frame implementation (the underscored functions).
+
+Kernels only take numeric arrays, string columns (team_id, ball_owning_team_id, position_name) are encoded before calling them,
+see _encoding.
+
+Kernels are compiled (or loaded from the cache) when this module is imported, the compute_*_pl functions import it on first use,
+such that importing unravel does not compile them.
+"""
+
+import math
+
+import numpy as np
+from numba import njit, prange, types
+
+from ._encoding import (
+    ROLE_BALL,
+    ROLE_ATTACKING,
+    ROLE_DEFENDING,
+    ADJACENCY_DENSE,
+    ADJACENCY_DENSE_AP,
+    ADJACENCY_DENSE_DP,
+    ADJACENCY_SPLIT_BY_TEAM,
+    CONNECT_NONE,
+    CONNECT_BALL,
+    CONNECT_BALL_CARRIER,
+)
+
+# fastmath without 'nnan' and 'ninf', padded and missing objects have NaN values we need to handle
+FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+# array arguments are typed as readonly and any layout, such that (zero-copy) Polars buffers and slices are accepted as is
+float64_1d = types.Array(types.float64, 1, "A", readonly=True)
+int8_1d = types.Array(types.int8, 1, "A", readonly=True)
+bool_1d = types.Array(types.boolean, 1, "A", readonly=True)
+int32_2d = types.Array(types.int32, 2, "A", readonly=True)
+float64_2d = types.Array(types.float64, 2, "A", readonly=True)
+int8_2d = types.Array(types.int8, 2, "A", readonly=True)
+bool_2d = types.Array(types.boolean, 2, "A", readonly=True)
+int32_3d = types.Array(types.int32, 3, "A", readonly=True)
+int64_1d = types.Array(types.int64, 1, "A", readonly=True)
+
+N_EDGE_FEATURES = 6
+N_NODE_FEATURES = 15
+
+
+@njit(cache=True, fastmath=FASTMATH)
+def _adjacency_matrix(a, role, ball_carrier_idx, adjacency_type, connect_type):
+    n = role.shape[0]
+
+    for i in range(n):
+        for j in range(n):
+            if adjacency_type == ADJACENCY_DENSE:
+                a[i, j] = 1
+            elif adjacency_type == ADJACENCY_DENSE_AP:
+                a[i, j] = role[i] == ROLE_ATTACKING and role[j] == ROLE_ATTACKING
+            elif adjacency_type == ADJACENCY_DENSE_DP:
+                a[i, j] = role[i] == ROLE_DEFENDING and role[j] == ROLE_DEFENDING
+            else:
+                a[i, j] = role[i] == role[j]
+
+    if connect_type == CONNECT_BALL:
+        for i in range(n):
+            for j in range(n):
+                if role[i] == ROLE_BALL or role[j] == ROLE_BALL:
+                    a[i, j] = 1
+    elif connect_type == CONNECT_BALL_CARRIER and ball_carrier_idx >= 0:
+        for j in range(n):
+            if role[ball_carrier_idx] == ROLE_BALL or role[j] == ROLE_BALL:
+                a[ball_carrier_idx, j] = 1
+                a[j, ball_carrier_idx] = 1
+
+
+@njit(cache=True, fastmath=FASTMATH)
+def _polar(dx, dy):
+    """
+    Length and direction (cos, sin) of the vector (dx, dy), computed from a single norm instead of atan2 + cos / sin.
+    A zero length vector has direction (1, 0), like atan2(0, 0) = 0.
+    """
+    norm = math.sqrt(dx * dx + dy * dy)
+    if norm == 0:
+        return norm, 1.0, 0.0
+    return norm, dx / norm, dy / norm
+
+
+@njit(cache=True, fastmath=FASTMATH)
+def _n_edges(a):
+    n_edges = 0
+    for i in range(a.shape[0]):
+        for j in range(a.shape[1]):
+            if a[i, j] == 1:
+                n_edges += 1
+    return n_edges
+
+
+@njit(cache=True, fastmath=FASTMATH)
+def _edge_features(
+    e, a, x, y, z, s, vx, vy, is_ball, max_dist, max_ball_speed, max_player_speed
+):
+    """
+    Compute the edge features for every non-zero entry of the adjacency matrix 'a' (in row-major order, like np.where(a == 1)).
+    Features are: distance, speed difference, position angle (cos, sin) and velocity angle (cos, sin), all normalized.
+    """
+    n = a.shape[0]
+
+    k = 0
+    for i in range(n):
+        max_speed = max_ball_speed if is_ball[i] else max_player_speed
+        for j in range(n):
+            if a[i, j] != 1:
+                continue
+
+            # the planar geometry (norm and unit vector) is computed once and shared by the distance and angle features
+            dx = x[i] - x[j]
+            dy = y[i] - y[j]
+            dz = z[i] - z[j]
+            p_norm, pos_cos, pos_sin = _polar(dx, dy)
+            dist = math.sqrt(p_norm * p_norm + dz * dz)
+            is_nan = math.isnan(dist)
+
+            # velocity difference and the unit vectors of position and velocity difference
+            dvx = vx[j] - vx[i]
+            dvy = vy[j] - vy[i]
+            v_norm = math.sqrt(dvx * dvx + dvy * dvy)
+            ux, uy = (0.0, 0.0) if p_norm == 0 else (pos_cos, pos_sin)
+            uvx, uvy = (0.0, 0.0) if v_norm == 0 else (dvx / v_norm, dvy / v_norm)
+            dot = ux * uvx + uy * uvy
+            if math.isnan(dot):
+                e[k, 4] = 0.5
+                e[k, 5] = 0.5
+            else:
+                # cos(acos(dot)) and sin(acos(dot))
+                vel_cos = min(max(dot, -1.0), 1.0)
+                e[k, 4] = (vel_cos + 1) / 2
+                e[k, 5] = (math.sqrt(1.0 - vel_cos * vel_cos) + 1) / 2
+
+            if not is_nan:
+                e[k, 0] = dist / max_dist
+
+                ds = s[j] - s[i]
+                if ds > 0:
+                    e[k, 1] = min(ds / max_speed, 1.0)
+
+                e[k, 2] = (pos_cos + 1) / 2
+                e[k, 3] = (pos_sin + 1) / 2
+
+            k += 1
+
+
+@njit(cache=True, fastmath=FASTMATH)
+def _node_features(
+    X,
+    x,
+    y,
+    s,
+    vx,
+    vy,
+    role,
+    is_gk,
+    ball_carrier,
+    x_min,
+    x_max,
+    y_min,
+    y_max,
+    max_dist,
+    max_ball_speed,
+    max_player_speed,
+    defending_team_node_value,
+    goal_y,
+):
+    n = x.shape[0]
+
+    ball_x, ball_y = 0.0, 0.0
+    for i in range(n):
+        if role[i] == ROLE_BALL:
+            ball_x, ball_y = x[i], y[i]
+            break
+
+    goal_x = x_max
+
+    for i in range(n):
+        is_ball = role[i] == ROLE_BALL
+        max_speed = max_ball_speed if is_ball else max_player_speed
+
+        v_norm = math.sqrt(vx[i] * vx[i] + vy[i] * vy[i])
+        if v_norm == 0:
+            v_norm = 1.0
+        angle = (math.atan2(vy[i] / v_norm, vx[i] / v_norm) + math.pi) / (2 * math.pi)
+
+        goal_dist, goal_cos, goal_sin = _polar(goal_x - x[i], goal_y - y[i])
+        ball_dist, ball_cos, ball_sin = _polar(ball_x - x[i], ball_y - y[i])
+
+        X[i, 0] = (x[i] - x_min) / (x_max - x_min)
+        X[i, 1] = (y[i] - y_min) / (y_max - y_min)
+        X[i, 2] = 0.0 if math.isnan(s[i]) else min(max(s[i] / max_speed, 0.0), 1.0)
+        X[i, 3] = (math.sin(angle) + 1) / 2
+        X[i, 4] = (math.cos(angle) + 1) / 2
+        X[i, 5] = goal_dist / max_dist
+        X[i, 6] = ball_dist / max_dist
+        X[i, 7] = 1.0 if role[i] == ROLE_ATTACKING else defending_team_node_value
+        X[i, 8] = is_gk[i]
+        X[i, 9] = 1.0 if is_ball else 0.0
+        X[i, 10] = (goal_sin + 1) / 2
+        X[i, 11] = (goal_cos + 1) / 2
+        X[i, 12] = (ball_sin + 1) / 2
+        X[i, 13] = (ball_cos + 1) / 2
+        X[i, 14] = ball_carrier[i]
+
+    for i in range(n):
+        for f in range(N_NODE_FEATURES):
+            if math.isnan(X[i, f]):
+                X[i, f] = 0.0
+
+
+@njit(
+    types.int32[:, :](int8_1d, types.int64, types.int64, types.int64),
+    cache=True,
+    fastmath=FASTMATH,
+)
+def adjacency_matrix_nb(role, ball_carrier_idx, adjacency_type, connect_type):
+    n = role.shape[0]
+    a = np.zeros((n, n), dtype=np.int32)
+    _adjacency_matrix(a, role, ball_carrier_idx, adjacency_type, connect_type)
+    return a
+
+
+@njit(
+    types.int32[:, :, :](int8_2d, int64_1d, types.int64, types.int64),
+    cache=True,
+    fastmath=FASTMATH,
+    parallel=True,
+)
+def adjacency_matrix_batch_nb(role, ball_carrier_idx, adjacency_type, connect_type):
+    n_frames, n = role.shape
+    a = np.zeros((n_frames, n, n), dtype=np.int32)
+    for f in prange(n_frames):
+        _adjacency_matrix(
+            a[f], role[f], ball_carrier_idx[f], adjacency_type, connect_type
+        )
+    return a
+
+
+@njit(
+    types.float64[:, :](
+        int32_2d,
+        *[float64_1d] * 6,
+        bool_1d,
+        *[types.float64] * 3,
+    ),
+    cache=True,
+    fastmath=FASTMATH,
+)
+def edge_features_nb(
+    a, x, y, z, s, vx, vy, is_ball, max_dist, max_ball_speed, max_player_speed
+):
+    e = np.zeros((_n_edges(a), N_EDGE_FEATURES), dtype=np.float64)
+    _edge_features(
+        e, a, x, y, z, s, vx, vy, is_ball, max_dist, max_ball_speed, max_player_speed
+    )
+    return e
+
+
+@njit(
+    types.Tuple((types.float64[:, :], types.int64[:]))(
+        int32_3d,
+        *[float64_2d] * 6,
+        bool_2d,
+        *[types.float64] * 3,
+    ),
+    cache=True,
+    fastmath=FASTMATH,
+    parallel=True,
+)
+def edge_features_batch_nb(
+    a, x, y, z, s, vx, vy, is_ball, max_dist, max_ball_speed, max_player_speed
+):
+    """
+    Returns the edge features of all frames stacked in a single (n_edges, N_EDGE_FEATURES) array,
+    and the offsets such that the edges of frame f live at [offsets[f]:offsets[f + 1]].
+    """
+    n_frames = a.shape[0]
+
+    offsets = np.zeros(n_frames + 1, dtype=np.int64)
+    for f in prange(n_frames):
+        offsets[f + 1] = _n_edges(a[f])
+    offsets = np.cumsum(offsets)
+
+    e = np.zeros((offsets[-1], N_EDGE_FEATURES), dtype=np.float64)
+    for f in prange(n_frames):
+        _edge_features(
+            e[offsets[f] : offsets[f + 1]],
+            a[f],
+            x[f],
+            y[f],
+            z[f],
+            s[f],
+            vx[f],
+            vy[f],
+            is_ball[f],
+            max_dist,
+            max_ball_speed,
+            max_player_speed,
+        )
+    return e, offsets
+
+
+@njit(
+    types.float64[:, :](
+        *[float64_1d] * 5,
+        int8_1d,
+        *[float64_1d] * 2,
+        *[types.float64] * 9,
+    ),
+    cache=True,
+    fastmath=FASTMATH,
+)
+def node_features_nb(
+    x,
+    y,
+    s,
+    vx,
+    vy,
+    role,
+    is_gk,
+    ball_carrier,
+    x_min,
+    x_max,
+    y_min,
+    y_max,
+    max_dist,
+    max_ball_speed,
+    max_player_speed,
+    defending_team_node_value,
+    goal_y,
+):
+    X = np.zeros((x.shape[0], N_NODE_FEATURES), dtype=np.float64)
+    _node_features(
+        X,
+        x,
+        y,
+        s,
+        vx,
+        vy,
+        role,
+        is_gk,
+        ball_carrier,
+        x_min,
+        x_max,
+        y_min,
+        y_max,
+        max_dist,
+        max_ball_speed,
+        max_player_speed,
+        defending_team_node_value,
+        goal_y,
+    )
+    return X
+
+
+@njit(
+    types.float64[:, :, :](
+        *[float64_2d] * 5,
+        int8_2d,
+        *[float64_2d] * 2,
+        *[types.float64] * 9,
+    ),
+    cache=True,
+    fastmath=FASTMATH,
+    parallel=True,
+)
+def node_features_batch_nb(
+    x,
+    y,
+    s,
+    vx,
+    vy,
+    role,
+    is_gk,
+    ball_carrier,
+    x_min,
+    x_max,
+    y_min,
+    y_max,
+    max_dist,
+    max_ball_speed,
+    max_player_speed,
+    defending_team_node_value,
+    goal_y,
+):
+    n_frames, n = x.shape
+    X = np.zeros((n_frames, n, N_NODE_FEATURES), dtype=np.float64)
+    for f in prange(n_frames):
+        _node_features(
+            X[f],
+            x[f],
+            y[f],
+            s[f],
+            vx[f],
+            vy[f],
+            role[f],
+            is_gk[f],
+            ball_carrier[f],
+            x_min,
+            x_max,
+            y_min,
+            y_max,
+            max_dist,
+            max_ball_speed,
+            max_player_speed,
+            defending_team_node_value,
+            goal_y,
+        )
+    return X
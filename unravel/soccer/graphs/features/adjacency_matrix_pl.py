@@ -1,44 +1,63 @@
 import numpy as np
-from scipy.spatial import Delaunay
 
 
-from ....utils import AdjacencyMatrixType, AdjacenyMatrixConnectType, distance_to_ball
+from ....utils import AdjacencyMatrixType, AdjacenyMatrixConnectType
 from ...dataset.kloppy_polars import Constant
+from ._encoding import (
+    encode_roles,
+    ADJACENCY_DENSE,
+    ADJACENCY_DENSE_AP,
+    ADJACENCY_DENSE_DP,
+    ADJACENCY_SPLIT_BY_TEAM,
+    CONNECT_NONE,
+    CONNECT_BALL,
+    CONNECT_BALL_CARRIER,
+)
+
+ADJACENCY_TYPES = {
+    AdjacencyMatrixType.DENSE: ADJACENCY_DENSE,
+    AdjacencyMatrixType.DENSE_AP: ADJACENCY_DENSE_AP,
+    AdjacencyMatrixType.DENSE_DP: ADJACENCY_DENSE_DP,
+    AdjacencyMatrixType.SPLIT_BY_TEAM: ADJACENCY_SPLIT_BY_TEAM,
+}
+
+CONNECT_TYPES = {
+    AdjacenyMatrixConnectType.BALL: CONNECT_BALL,
+    AdjacenyMatrixConnectType.BALL_CARRIER: CONNECT_BALL_CARRIER,
+    AdjacenyMatrixConnectType.NO_CONNECTION: CONNECT_NONE,
+}
 
 
 def compute_adjacency_matrix_pl(team, ball_owning_team, settings, ball_carrier_idx):
+    """
+    Compute the adjacency matrix of a single frame (team and ball_owning_team of shape (n_nodes,), ball_carrier_idx int or None)
+    or of a batch of equally sized frames (shape (n_frames, n_nodes), ball_carrier_idx array of shape (n_frames,) with -1 for no ball carrier).
+    """
+    from ._numba import adjacency_matrix_nb, adjacency_matrix_batch_nb
+
     adjacency_matrix_type = settings.adjacency_matrix_type
     adjacency_matrix_connect_type = settings.adjacency_matrix_connect_type
-    ball_id = Constant.BALL
-
-    exclusion_ids = np.asarray([ball_id, *np.unique(ball_owning_team)])
-
-    defensive_team = np.setdiff1d(team, exclusion_ids)[0]
-    if adjacency_matrix_type == AdjacencyMatrixType.DENSE:
-        adjacency_matrix = np.ones((team.shape[0], team.shape[0])).astype(np.int32)
-    elif adjacency_matrix_type == AdjacencyMatrixType.DENSE_AP:
-        is_att = team == np.unique(ball_owning_team)[0]
-        adjacency_matrix = np.outer(is_att, is_att).astype(int)
-    elif adjacency_matrix_type == AdjacencyMatrixType.DENSE_DP:
-        is_def = team == defensive_team
-        adjacency_matrix = np.outer(is_def, is_def).astype(int)
-    elif adjacency_matrix_type == AdjacencyMatrixType.SPLIT_BY_TEAM:
-        # Create a pairwise team comparison matrix
-        adjacency_matrix = np.equal(team[:, None], team[None, :]).astype(np.int32)
-    elif adjacency_matrix_type == AdjacencyMatrixType.DELAUNAY:
+
+    if adjacency_matrix_type == AdjacencyMatrixType.DELAUNAY:
         raise NotImplementedError("Delaunay matrix not implemented for Soccer...")
-    else:
+    elif adjacency_matrix_type not in ADJACENCY_TYPES:
         raise NotImplementedError("Please specify an existing AdjacencyMatrixType...")
 
-    if adjacency_matrix_connect_type:
-        # Create a mask where either team is "ball"
-        ball_mask = (team[:, None] == ball_id) | (team[None, :] == ball_id)
-        if adjacency_matrix_connect_type == AdjacenyMatrixConnectType.BALL:
-            # Set entries to 1 where either team is "ball"
-            adjacency_matrix = np.where(ball_mask, 1, adjacency_matrix)
-        elif adjacency_matrix_connect_type == AdjacenyMatrixConnectType.BALL_CARRIER:
-            if ball_carrier_idx is not None:
-                adjacency_matrix[ball_carrier_idx, ball_mask[ball_carrier_idx, :]] = 1
-                adjacency_matrix[ball_mask[:, ball_carrier_idx], ball_carrier_idx] = 1
-
-    return adjacency_matrix
+    role = encode_roles(team, ball_owning_team, ball_id=Constant.BALL)
+    adjacency_type = ADJACENCY_TYPES[adjacency_matrix_type]
+    connect_type = CONNECT_TYPES.get(adjacency_matrix_connect_type, CONNECT_NONE)
+
+    if role.ndim == 2:
+        return adjacency_matrix_batch_nb(
+            role,
+            np.asarray(ball_carrier_idx, dtype=np.int64),
+            adjacency_type,
+            connect_type,
+        )
+
+    return adjacency_matrix_nb(
+        role,
+        -1 if ball_carrier_idx is None else int(ball_carrier_idx),
+        adjacency_type,
+        connect_type,
+    )
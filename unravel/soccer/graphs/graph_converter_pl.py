@@ -3,7 +3,7 @@ import sys
 
 from dataclasses import dataclass
 
-from typing import List, Union, Dict, Literal, Any, Optional
+from typing import List, Union, Dict, Literal, Any, Optional, Tuple, Iterator
 
 from kloppy.domain import (
     MetricPitchDimensions,
@@ -18,8 +18,10 @@ from .features import (
     compute_adjacency_matrix_pl,
     compute_edge_features_pl,
 )
+from .features._encoding import ROLE_BALL, ROLE_ATTACKING, ROLE_DEFENDING
 
 from ...utils import *
+from ...utils.objects.custom_spektral_dataset import open_pickle_file, PICKLE_EXTENSIONS
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
@@ -27,7 +29,7 @@ stdout_handler = logging.StreamHandler(sys.stdout)
 logger.addHandler(stdout_handler)
 
 
-@dataclass(repr=True)
+@dataclass(repr=False)
 class SoccerGraphConverterPolars(DefaultGraphConverter):
     """
     Converts our dataset TrackingDataset into an internal structure
@@ -77,6 +79,17 @@ class SoccerGraphConverterPolars(DefaultGraphConverter):
 
         self._shuffle()
 
+        # converted (compact, binary) graph data, see __iter_graph_data
+        self._graph_df: Optional[pl.DataFrame] = None
+
+    def __repr__(self) -> str:
+        return (
+            f"SoccerGraphConverterPolars("
+            f"adjacency_matrix_type={self.adjacency_matrix_type}, "
+            f"adjacency_matrix_connect_type={self.adjacency_matrix_connect_type}, "
+            f"self_loop_ball={self.self_loop_ball}, pad={self.pad}, chunk_size={self.chunk_size})"
+        )
+
     def _shuffle(self):
         if isinstance(self.settings.random_seed, int):
             self.dataset = self.dataset.sample(
@@ -136,7 +149,10 @@ class SoccerGraphConverterPolars(DefaultGraphConverter):
             Column.BALL_OWNING_TEAM_ID,
         ]
 
-        counts = df.group_by(group_by_columns).agg(
+        # everything below is a single lazy query, such that Polars can share the work between the group_bys
+        lf = df.lazy()
+
+        counts = lf.group_by(group_by_columns).agg(
             pl.len().alias("count"), *[pl.first(col).alias(col) for col in keep_columns]
         )
 
@@ -155,15 +171,15 @@ class SoccerGraphConverterPolars(DefaultGraphConverter):
             pl.col("count") < pl.col("target_length")
         ).with_columns((pl.col("target_length") - pl.col("count")).alias("repeats"))
 
-        if len(groups_to_pad) == 0:
-            return df
-
-        padding_rows = []
-        for row in groups_to_pad.iter_rows(named=True):
-            base_row = {col: row[col] for col in keep_columns + group_by_columns}
-            padding_rows.extend([base_row] * row["repeats"])
-
-        padding_df = pl.DataFrame(padding_rows)
+        padding_df = (
+            groups_to_pad.select(
+                *keep_columns,
+                *group_by_columns,
+                pl.int_ranges(0, pl.col("repeats")).alias("__repeat"),
+            )
+            .explode("__repeat")
+            .drop("__repeat")
+        )
 
         schema = df.schema
         padding_df = padding_df.with_columns(
@@ -177,48 +193,51 @@ class SoccerGraphConverterPolars(DefaultGraphConverter):
 
         padding_df = padding_df.select(df.columns)
 
-        result = pl.concat([df, padding_df], how="vertical")
-
-        total_frames = result.select(Group.BY_FRAME).unique().height
+        result = pl.concat([lf, padding_df], how="vertical")
 
         frame_completeness = (
-            result.group_by(Group.BY_FRAME)
-            .agg(
-                [
-                    (pl.col(Column.TEAM_ID).eq(Constant.BALL).sum() == 1).alias(
-                        "has_ball"
-                    ),
-                    (
-                        pl.col(Column.TEAM_ID)
-                        .eq(pl.col(Column.BALL_OWNING_TEAM_ID))
-                        .sum()
-                        == 11
-                    ).alias("has_owning_team"),
-                    (
-                        (
-                            ~pl.col(Column.TEAM_ID).eq(Constant.BALL)
-                            & ~pl.col(Column.TEAM_ID).eq(
-                                pl.col(Column.BALL_OWNING_TEAM_ID)
-                            )
-                        ).sum()
-                        == 11
-                    ).alias("has_other_team"),
-                ]
+            result.with_columns(
+                pl.when(pl.col(Column.TEAM_ID) == Constant.BALL)
+                .then(ROLE_BALL)
+                .when(pl.col(Column.TEAM_ID) == pl.col(Column.BALL_OWNING_TEAM_ID))
+                .then(ROLE_ATTACKING)
+                .otherwise(ROLE_DEFENDING)
+                .cast(pl.UInt8)
+                .alias("__role")
             )
-            .filter(
-                pl.col("has_ball")
-                & pl.col("has_owning_team")
-                & pl.col("has_other_team")
+            .group_by(Group.BY_FRAME)
+            .agg(
+                (
+                    (pl.col("__role").eq(ROLE_BALL).sum() == 1)
+                    & (pl.col("__role").eq(ROLE_ATTACKING).sum() == 11)
+                    & (pl.col("__role").eq(ROLE_DEFENDING).sum() == 11)
+                ).alias("is_complete")
             )
         )
 
-        complete_frames = frame_completeness.height
+        result, frame_counts = pl.collect_all(
+            [
+                result.join(
+                    frame_completeness.filter(pl.col("is_complete")).select(
+                        Group.BY_FRAME
+                    ),
+                    on=Group.BY_FRAME,
+                    how="inner",
+                ),
+                frame_completeness.select(
+                    pl.len().alias("total_frames"),
+                    pl.col("is_complete").sum().alias("complete_frames"),
+                ),
+            ]
+        )
+
+        total_frames, complete_frames = frame_counts.row(0)
 
         dropped_frames = total_frames - complete_frames
         if dropped_frames > 0 and self.verbose:
             self.__warn_dropped_frames(dropped_frames, total_frames)
 
-        return result.join(frame_completeness, on=Group.BY_FRAME, how="inner")
+        return result
 
     @staticmethod
     def __warn_dropped_frames(dropped_frames, total_frames):
@@ -295,7 +314,7 @@ class SoccerGraphConverterPolars(DefaultGraphConverter):
             Column.AY,
             Column.AZ,
             Column.TEAM_ID,
-            Column.POSITION_NAME,
+            "__is_gk",
             Column.BALL_OWNING_TEAM_ID,
             Column.IS_BALL_CARRIER,
             self.graph_id_column,
@@ -306,46 +325,24 @@ class SoccerGraphConverterPolars(DefaultGraphConverter):
             if self.graph_feature_cols is None
             else exprs_variables + self.graph_feature_cols
         )
-        return exprs
-
-    def __compute(self, args: List[pl.Series]) -> dict:
-        d = {col: args[i].to_numpy() for i, col in enumerate(self.__exprs_variables)}
-
-        if self.graph_feature_cols is not None:
-            failed = [
-                col
-                for col in self.graph_feature_cols
-                if not np.all(d[col] == d[col][0])
-            ]
-            if failed:
-                raise ValueError(
-                    f"""graph_feature_cols contains multiple different values for a group in the groupby ({Group.BY_FRAME}) selection for the columns {failed}. Make sure each group has the same values per individual column."""
-                )
+        # graph_feature_cols can overlap with the columns above (e.g. the label), every column is only gathered once
+        return list(dict.fromkeys(exprs))
 
+    def __compute(self, d: Dict[str, np.ndarray]) -> dict:
+        """
+        Compute the graph of a single frame (every array in d is of shape (n_nodes,)),
+        or the graphs of a batch of equally sized frames (every array in d is of shape (n_frames, n_nodes)).
+        """
         graph_features = (
-            np.asarray([d[col] for col in self.graph_feature_cols]).T[0]
+            np.stack([d[col][..., 0] for col in self.graph_feature_cols], axis=-1)
             if self.graph_feature_cols
             else None
         )
 
-        if not np.all(d[self.graph_id_column] == d[self.graph_id_column][0]):
-            raise ValueError(
-                "graph_id selection contains multiple different values. Make sure each graph_id is unique by at least game_id and frame_id..."
-            )
-
-        if not self.prediction and not np.all(
-            d[self.label_column] == d[self.label_column][0]
-        ):
-            raise ValueError(
-                """Label selection contains multiple different values for a single selection (group by) of game_id and frame_id, 
-                make sure this is not the case. Each group can only have 1 label."""
-            )
-
-        ball_carriers = np.where(d[Column.IS_BALL_CARRIER] == True)[0]
-        if len(ball_carriers) == 0:
-            ball_carrier_idx = None
-        else:
-            ball_carrier_idx = ball_carriers[0]
+        ball_carriers = np.asarray(d[Column.IS_BALL_CARRIER] == True)
+        ball_carrier_idx = np.where(
+            ball_carriers.any(axis=-1), ball_carriers.argmax(axis=-1), -1
+        )
 
         adjacency_matrix = compute_adjacency_matrix_pl(
             team=d[Column.TEAM_ID],
@@ -354,118 +351,328 @@ class SoccerGraphConverterPolars(DefaultGraphConverter):
             ball_carrier_idx=ball_carrier_idx,
         )
 
-        velocity = np.stack((d[Column.VX], d[Column.VY]), axis=-1)
         edge_features = compute_edge_features_pl(
             adjacency_matrix=adjacency_matrix,
-            p3d=np.stack((d[Column.X], d[Column.Y], d[Column.Z]), axis=-1),
-            p2d=np.stack((d[Column.X], d[Column.Y]), axis=-1),
+            x=d[Column.X],
+            y=d[Column.Y],
+            z=d[Column.Z],
             s=d[Column.SPEED],
-            velocity=velocity,
+            vx=d[Column.VX],
+            vy=d[Column.VY],
             team=d[Column.TEAM_ID],
             settings=self.settings,
         )
 
         node_features = compute_node_features_pl(
-            d[Column.X],
-            d[Column.Y],
+            x=d[Column.X],
+            y=d[Column.Y],
             s=d[Column.SPEED],
-            velocity=velocity,
+            vx=d[Column.VX],
+            vy=d[Column.VY],
             team=d[Column.TEAM_ID],
             possession_team=d[Column.BALL_OWNING_TEAM_ID],
-            is_gk=(d[Column.POSITION_NAME] == self.settings.goalkeeper_id).astype(int),
+            is_gk=d["__is_gk"],
             ball_carrier=d[Column.IS_BALL_CARRIER],
             graph_features=graph_features,
             settings=self.settings,
         )
 
         return {
-            "e": edge_features.tolist(),
-            "x": node_features.tolist(),
-            "a": adjacency_matrix.tolist(),
-            self.graph_id_column: d[self.graph_id_column][0],
-            self.label_column: d[self.label_column][0],
+            "e": edge_features,
+            "x": node_features,
+            "a": adjacency_matrix,
+            self.graph_id_column: d[self.graph_id_column][..., 0].tolist(),
+            self.label_column: d[self.label_column][..., 0].tolist(),
         }
 
     @property
     def return_dtypes(self):
-        return pl.Struct(
-            {
-                "e": pl.List(pl.List(pl.Float64)),
-                "x": pl.List(pl.List(pl.Float64)),
-                "a": pl.List(pl.List(pl.Float64)),
-                self.graph_id_column: pl.String,
-                self.label_column: pl.Int64,
-            }
+        return {
+            "e": pl.Binary,
+            "x": pl.Binary,
+            "a": pl.Binary,
+            "a_indptr": pl.Binary,
+            "e_shape_0": pl.Int64,
+            "e_shape_1": pl.Int64,
+            "x_shape_0": pl.Int64,
+            "x_shape_1": pl.Int64,
+            "a_shape_0": pl.Int64,
+            "a_shape_1": pl.Int64,
+            self.graph_id_column: pl.String,
+            self.label_column: pl.Int64,
+        }
+
+    @property
+    def buffer_dtypes(self):
+        """
+        Numpy dtypes of the flat "e" and "x" buffers, features are stored in single precision (the precision TensorFlow / Spektral train in).
+        The adjacency matrix is stored in CSR format, "a" holds the column indices and "a_indptr" the row pointers.
+        """
+        return {
+            "a": np.int32,
+            "a_indptr": np.int32,
+            "e": np.float32,
+            "x": np.float32,
+        }
+
+    @staticmethod
+    def _csr_components(a: np.ndarray) -> Tuple[List[np.ndarray], List[np.ndarray]]:
+        """
+        Convert a batch of dense 0/1 adjacency matrices of shape (n_frames, n_nodes, n_nodes)
+        into the CSR column indices and row pointers of every frame.
+        """
+        indptr = np.zeros((a.shape[0], a.shape[1] + 1), dtype=np.int32)
+        np.cumsum(np.count_nonzero(a, axis=2), axis=1, out=indptr[:, 1:])
+        indices = np.nonzero(a)[2]
+        return np.split(indices, np.cumsum(indptr[:-1, -1])), list(indptr)
+
+    def __validate_frames(self, n_unique: pl.DataFrame):
+        """
+        Check that graph_id, label and graph_feature_cols have a single value per frame,
+        n_unique holds the maximum number of unique values per frame for each of these columns.
+        """
+        if self.graph_feature_cols is not None:
+            failed = [
+                col for col in self.graph_feature_cols if n_unique[col].item() > 1
+            ]
+            if failed:
+                raise ValueError(
+                    f"""graph_feature_cols contains multiple different values for a group in the groupby ({Group.BY_FRAME}) selection for the columns {failed}. Make sure each group has the same values per individual column."""
+                )
+
+        if n_unique[self.graph_id_column].item() > 1:
+            raise ValueError(
+                "graph_id selection contains multiple different values. Make sure each graph_id is unique by at least game_id and frame_id..."
+            )
+
+        if not self.prediction and n_unique[self.label_column].item() > 1:
+            raise ValueError(
+                """Label selection contains multiple different values for a single selection (group by) of game_id and frame_id, 
+                make sure this is not the case. Each group can only have 1 label."""
+            )
+
+    def __frame_arrays(self) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+        """
+        Gather all rows belonging to the same frame next to each other (keeping the order in which frames, and rows within a frame, appear)
+        and convert every required column to numpy exactly once.
+
+        The dataset is partitioned by game_id and the per game group_by plans are collected together (pl.collect_all), such that
+        Polars can run them in parallel. The row index is added before partitioning, such that sorting the concatenated frames on
+        their first row restores the order of the whole dataset (e.g. interleaved games or a shuffled dataset).
+
+        Returns the column arrays and the frame offsets, such that frame i lives at [offsets[i]:offsets[i + 1]].
+        """
+        columns = self.__exprs_variables
+        unique_columns = list(
+            dict.fromkeys(
+                [self.graph_id_column, self.label_column]
+                + (self.graph_feature_cols or [])
+            )
         )
 
-    def _convert(self):
-        # Group and aggregate in one step
-        return (
-            self.dataset.group_by(Group.BY_FRAME, maintain_order=True)
-            .agg(
-                pl.map_groups(
-                    exprs=self.__exprs_variables,
-                    function=self.__compute,
-                    return_dtype=self.return_dtypes,
-                ).alias("result_dict")
+        dataset = self.dataset.with_row_index("__row_nr")
+
+        frames = pl.concat(
+            pl.collect_all(
+                [
+                    df.lazy().with_columns(
+                        (pl.col(Column.POSITION_NAME) == self.settings.goalkeeper_id)
+                        .fill_null(False)
+                        .cast(pl.UInt8)
+                        .alias("__is_gk")
+                    )
+                    # an unordered group_by can run in parallel, the frame order is restored below by sorting on the first row of each frame
+                    # group keys are aliased, such that they can also be aggregated (e.g. frame_id used as graph_id)
+                    .group_by(
+                        [pl.col(col).alias(f"__{col}") for col in Group.BY_FRAME]
+                    ).agg(
+                        pl.col("__row_nr").first(),
+                        pl.len().alias("__n_rows"),
+                        *[
+                            pl.col(col).n_unique().alias(f"__n_unique_{col}")
+                            for col in unique_columns
+                        ],
+                        *columns,
+                    )
+                    # partition_by returns no partitions for an empty dataset, in that case we group the (empty) dataset itself
+                    for df in (
+                        dataset.partition_by(Column.GAME_ID, maintain_order=True)
+                        or [dataset]
+                    )
+                ]
+            )
+        ).sort("__row_nr")
+
+        self.__validate_frames(
+            frames.select(
+                pl.col(f"__n_unique_{col}").max().fill_null(0).alias(col)
+                for col in unique_columns
             )
-            .unnest("result_dict")
         )
 
-    def to_graph_frames(self) -> List[dict]:
-        def process_chunk(chunk: pl.DataFrame) -> List[dict]:
-            return [
+        offsets = np.zeros(len(frames) + 1, dtype=np.int64)
+        np.cumsum(frames["__n_rows"].to_numpy(), out=offsets[1:])
+
+        data = frames.select(columns).explode(columns)
+        return {col: data[col].to_numpy() for col in data.columns}, offsets
+
+    def _convert(self) -> pl.DataFrame:
+        arrays, offsets = self.__frame_arrays()
+        n_nodes = np.diff(offsets)
+
+        if len(n_nodes) == 0:
+            return pl.DataFrame(schema=self.return_dtypes)
+
+        if self.pad and np.all(n_nodes == n_nodes[0]):
+            # padded frames all have the same number of nodes, so we compute them as a single batch
+            batch = self.__compute(
                 {
-                    "a": make_sparse(reshape_array(arr=chunk["a"][i])),
-                    "x": reshape_array(arr=chunk["x"][i]),
-                    "e": reshape_array(arr=chunk["e"][i]),
-                    "y": np.asarray([chunk[self.label_column][i]]),
-                    "id": chunk[self.graph_id_column][i],
+                    col: arr.reshape(len(n_nodes), n_nodes[0])
+                    for col, arr in arrays.items()
                 }
-                for i in range(len(chunk))
+            )
+            a_indices, a_indptr = self._csr_components(batch["a"])
+            results = {
+                "a": a_indices,
+                "a_indptr": a_indptr,
+                "a_shape": [a.shape for a in batch["a"]],
+                "e": batch["e"],
+                "x": list(batch["x"]),
+                self.graph_id_column: batch[self.graph_id_column],
+                self.label_column: batch[self.label_column],
+            }
+        else:
+            frames = [
+                self.__compute({col: arr[start:end] for col, arr in arrays.items()})
+                for start, end in zip(offsets[:-1], offsets[1:])
             ]
+            results = {key: [r[key] for r in frames] for key in frames[0]}
+            a_components = [self._csr_components(a[np.newaxis]) for a in results["a"]]
+            results["a_shape"] = [a.shape for a in results["a"]]
+            results["a"] = [indices[0] for indices, _ in a_components]
+            results["a_indptr"] = [indptr[0] for _, indptr in a_components]
 
-        graph_df = self._convert()
-        self.graph_frames = [
-            graph
-            for chunk in graph_df.lazy().collect().iter_slices(self.chunk_size)
-            for graph in process_chunk(chunk)
-        ]
+        return pl.DataFrame(
+            {
+                **{
+                    m: [arr.astype(dtype).tobytes() for arr in results[m]]
+                    for m, dtype in self.buffer_dtypes.items()
+                },
+                **{
+                    f"{m}_shape_{i}": [arr.shape[i] for arr in results[m]]
+                    for m in ["e", "x"]
+                    for i in [0, 1]
+                },
+                **{
+                    f"a_shape_{i}": [shape[i] for shape in results["a_shape"]]
+                    for i in [0, 1]
+                },
+                # graph ids and labels are cast non-strictly, e.g. integer graph ids become strings and
+                # missing labels (prediction=True) become null
+                **{
+                    col: pl.Series(results[col], strict=False).cast(
+                        self.return_dtypes[col], strict=False
+                    )
+                    for col in [self.graph_id_column, self.label_column]
+                },
+            },
+            schema=self.return_dtypes,
+        )
+
+    def __iter_graph_data(self) -> Iterator[Dict[str, Any]]:
+        """
+        Convert the dataset and yield the graph data (keyword arguments of spektral.data.Graph) one frame at a time,
+        decoding the converted buffers chunk by chunk.
+        The dataset is converted only once, the converted buffers are stored and decoded again on subsequent calls.
+        """
+        if self._graph_df is None:
+            self._graph_df = self._convert()
+
+        for chunk in self._graph_df.iter_slices(self.chunk_size):
+            a = [
+                csr_from_buffers(
+                    indices,
+                    indptr,
+                    s0,
+                    s1,
+                    dtype=self.buffer_dtypes["a"],
+                    indptr_dtype=self.buffer_dtypes["a_indptr"],
+                )
+                for indices, indptr, s0, s1 in zip(
+                    chunk["a"],
+                    chunk["a_indptr"],
+                    chunk["a_shape_0"],
+                    chunk["a_shape_1"],
+                )
+            ]
+            e, x = (
+                [
+                    reshape_from_buffer(buffer, s0, s1, dtype=self.buffer_dtypes[m])
+                    for buffer, s0, s1 in zip(
+                        chunk[m], chunk[f"{m}_shape_0"], chunk[f"{m}_shape_1"]
+                    )
+                ]
+                for m in ["e", "x"]
+            )
+            for i, (label, graph_id) in enumerate(
+                zip(chunk[self.label_column], chunk[self.graph_id_column])
+            ):
+                yield {
+                    "a": a[i],
+                    "x": x[i],
+                    "e": e[i],
+                    "y": np.asarray([np.nan if label is None else label]),
+                    "id": graph_id,
+                }
+
+    def to_graph_frames(self) -> List[dict]:
+        self.graph_frames = list(self.__iter_graph_data())
         return self.graph_frames
 
+    def iter_spektral_graphs(self) -> Iterator[Graph]:
+        """
+        Yield the spektral Graphs one at a time.
+        If to_graph_frames() has already been called the stored graph frames are re-used,
+        otherwise the Graphs are created directly from the converted data, without storing the intermediate graph frames.
+        The dataset is converted on the first call of any of the to_* / iter_* methods, later calls (e.g. to_spektral_graphs()
+        followed by to_pickle()) re-use the converted data.
+        This only saves memory when the Graphs are consumed one by one (e.g. written to disk), to_custom_dataset still
+        holds all Graphs in memory at once.
+        """
+        graph_data = (
+            self.graph_frames if self.graph_frames else self.__iter_graph_data()
+        )
+        for d in graph_data:
+            yield Graph(**d)
+
     def to_spektral_graphs(self) -> List[Graph]:
-        if not self.graph_frames:
-            self.to_graph_frames()
-
-        return [
-            Graph(
-                x=d["x"],
-                a=d["a"],
-                e=d["e"],
-                y=d["y"],
-                id=d["id"],
-            )
-            for d in self.graph_frames
-        ]
+        return list(self.iter_spektral_graphs())
+
+    def to_custom_dataset(self) -> CustomSpektralDataset:
+        """
+        Spektral requires a spektral Dataset to load the data
+        for docs see https://graphneural.network/creating-dataset/
+        The dataset holds all Graphs in a single list, passing them as graphs_iter does not lower the peak memory
+        compared to CustomSpektralDataset(graphs=self.to_spektral_graphs()).
+        """
+        return CustomSpektralDataset(graphs_iter=self.iter_spektral_graphs())
 
     def to_pickle(self, file_path: str, verbose: bool = False) -> None:
         """
         We store the 'dict' version of the Graphs to pickle each graph is now a dict with keys x, a, e, and y
+        Graphs are written to the file one after another, use load_pickle_gz to lazily read them back.
+        Files are compressed with gzip ('.pickle.gz') or zstandard ('.pickle.zst', requires the zstandard package).
         To use for training with Spektral feed the loaded pickle data to CustomDataset(data=pickled_data)
         """
-        if not file_path.endswith("pickle.gz"):
+        if not file_path.endswith(PICKLE_EXTENSIONS):
             raise ValueError(
-                "Only compressed pickle files of type 'some_file_name.pickle.gz' are supported..."
+                "Only compressed pickle files of type 'some_file_name.pickle.gz' or 'some_file_name.pickle.zst' are supported..."
             )
 
-        if not self.graph_frames:
-            self.to_graph_frames()
-
         if verbose:
-            print(f"Storing {len(self.graph_frames)} Graphs in {file_path}...")
+            print(f"Storing Graphs in {file_path}...")
 
         import pickle
-        import gzip
         from pathlib import Path
 
         path = Path(file_path)
@@ -473,5 +680,10 @@ class SoccerGraphConverterPolars(DefaultGraphConverter):
         directories = path.parent
         directories.mkdir(parents=True, exist_ok=True)
 
-        with gzip.open(file_path, "wb") as file:
-            pickle.dump(self.graph_frames, file)
+        # graphs are pickled one by one, such that we never hold the full (pickled) dataset in memory
+        graph_frames = (
+            self.graph_frames if self.graph_frames else self.__iter_graph_data()
+        )
+        with open_pickle_file(file_path, "wb") as file:
+            for graph_frame in graph_frames:
+                pickle.dump(graph_frame, file, protocol=pickle.HIGHEST_PROTOCOL)
@@ -1,3 +1,5 @@
+import numpy as np
+
 from dataclasses import dataclass
 
 from ...utils import DefaultGraphSettings
@@ -30,6 +32,32 @@ class GraphSettingsPolars(DefaultGraphSettings):
     def pitch_dimensions(self, pitch_dimensions: MetricPitchDimensions) -> None:
         self._pitch_dimensions = pitch_dimensions
 
+        # constants derived from the pitch dimensions are computed once here, instead of for every (batch of) frame(s)
+        if isinstance(pitch_dimensions, MetricPitchDimensions):
+            if (
+                pitch_dimensions.pitch_length is None
+                or pitch_dimensions.pitch_width is None
+            ):
+                raise ValueError(
+                    "pitch_dimensions should have a pitch_length and pitch_width..."
+                )
+            self._max_dist_to_player = float(
+                np.sqrt(
+                    pitch_dimensions.pitch_length**2 + pitch_dimensions.pitch_width**2
+                )
+            )
+            self._goal_y = float(
+                (pitch_dimensions.y_dim.max + pitch_dimensions.y_dim.min) / 2
+            )
+
+    @property
+    def max_dist_to_player(self) -> float:
+        return self._max_dist_to_player
+
+    @property
+    def goal_y(self) -> float:
+        return self._goal_y
+
     def _sport_specific_checks(self):
         if self.non_potential_receiver_node_value > 1:
             self.non_potential_receiver_node_value = 1
@@ -191,6 +191,23 @@ def reshape_from_size(arr, s0, s1):
     return np.array([item for sublist in arr for item in sublist]).reshape(s0, s1)
 
 
+def reshape_from_buffer(buffer, s0, s1, dtype=np.float64):
+    # copy, because arrays backed by an immutable bytes buffer are read-only
+    return np.frombuffer(buffer, dtype=dtype).reshape(s0, s1).copy()
+
+
+def csr_from_buffers(
+    indices_buffer, indptr_buffer, s0, s1, dtype=np.int32, indptr_dtype=np.int32
+):
+    # binary (0/1) sparse matrix from the CSR column indices and row pointers
+    indices = np.frombuffer(indices_buffer, dtype=dtype)
+    indptr = np.frombuffer(indptr_buffer, dtype=indptr_dtype)
+    return sparse.csr_matrix(
+        (np.ones(len(indices), dtype=np.int8), indices.copy(), indptr.copy()),
+        shape=(s0, s1),
+    )
+
+
 def distance_to_ball(
     x: np.array, y: np.array, team: np.array, ball_id: str, z: np.array = None
 ):
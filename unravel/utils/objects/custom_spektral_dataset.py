@@ -1,12 +1,15 @@
 import logging
 import sys
-from typing import List, Tuple, Union
+from typing import List, Tuple, Union, Iterable, Iterator
 
 import numpy as np
 
 import random
 
+from itertools import chain, islice
+
 import gzip
+import io
 import pickle
 from pathlib import Path
 
@@ -14,6 +17,7 @@ import warnings
 
 import tensorflow as tf
 
+from collections import defaultdict
 from collections.abc import Sequence
 
 from spektral.data import Dataset, Graph
@@ -24,11 +28,51 @@ from .default_graph_frame import DefaultGraphFrame
 from ..exceptions import NoGraphIdsWarning
 
 
-# Function to load data from a .pickle.gz file
-def load_pickle_gz(file_path):
-    with gzip.open(file_path, "rb") as f:
-        data = pickle.load(f)
-    return data
+PICKLE_EXTENSIONS = ("pickle.gz", "pickle.zst")
+
+
+def open_pickle_file(file_path, mode: str = "rb"):
+    """
+    Open a compressed pickle file, the compression is detected from the extension:
+    'some_file_name.pickle.gz' (gzip) or 'some_file_name.pickle.zst' (zstandard)
+    """
+    file_path = str(file_path)
+    if file_path.endswith("pickle.gz"):
+        return gzip.open(file_path, mode)
+    elif file_path.endswith("pickle.zst"):
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError(
+                "Seems like you don't have zstandard installed. Please"
+                " install it using: pip install zstandard"
+            )
+        if "r" in mode:
+            # the zstandard reader has no readline, which pickle needs for (text) protocol 0 pickles
+            return io.BufferedReader(zstandard.open(file_path, mode))
+        return zstandard.open(file_path, mode)
+    else:
+        raise ValueError(
+            "Only compressed pickle files of type 'some_file_name.pickle.gz' or 'some_file_name.pickle.zst' are supported..."
+        )
+
+
+# Function to lazily load data from a .pickle.gz (or .pickle.zst) file
+def load_pickle_gz(file_path) -> Iterator:
+    """
+    Yields the graphs stored in a .pickle.gz or .pickle.zst file one by one.
+    Supports both files with one pickled object per graph and files containing a single pickled list of graphs.
+    """
+    with open_pickle_file(file_path, "rb") as f:
+        while True:
+            try:
+                data = pickle.load(f)
+            except EOFError:
+                break
+            if isinstance(data, list):
+                yield from data
+            else:
+                yield data
 
 
 class CustomSpektralDataset(Dataset, Sequence):
@@ -48,8 +92,11 @@ class CustomSpektralDataset(Dataset, Sequence):
         if kwargs.get("pickle_folder", None):
             pickle_folder = Path(kwargs["pickle_folder"])
             self.graphs = None
-            # Loop over all .pickle.gz files in the folder
-            for pickle_file in pickle_folder.glob("*.pickle.gz"):
+            # Loop over all .pickle.gz and .pickle.zst files in the folder
+            pickle_files = chain.from_iterable(
+                pickle_folder.glob(f"*.{extension}") for extension in PICKLE_EXTENSIONS
+            )
+            for pickle_file in pickle_files:
                 data = load_pickle_gz(pickle_file)
                 if not self.graphs:
                     self.graphs = self.__convert(data)
@@ -71,30 +118,46 @@ class CustomSpektralDataset(Dataset, Sequence):
                 raise NotImplementedError("""data should be of type list""")
 
             self.graphs = kwargs["graphs"]
+
+        elif kwargs.get("graphs_iter", None) is not None:
+            # graphs_iter is materialized into a list, it does not lower the peak memory of the dataset
+            self.graphs = list(kwargs["graphs_iter"])
         else:
             raise NotImplementedError(
-                "Please provide either 'pickle_folder', 'pickle_file' or 'graphs' as parameter to CustomSpektralDataset"
+                "Please provide either 'pickle_folder', 'pickle_file', 'graphs' or 'graphs_iter' as parameter to CustomSpektralDataset"
             )
 
         super().__init__(**kwargs)
 
-    def __convert(self, data) -> List[Graph]:
+    def __sample_data(self, data: Iterable) -> Iterable:
         """
-        Convert incoming data to correct List[Graph] format
+        Keep every 1 / sample_rate'th item. Integer steps are taken with slicing, other sample rates keep
+        the items for which the index is an exact multiple of 1 / sample_rate.
         """
-        if isinstance(data[0], Graph):
-            return [g for i, g in enumerate(data) if i % self.sample == 0]
-        elif isinstance(data[0], DefaultGraphFrame):
-            return [
-                g.to_spektral_graph()
-                for i, g in enumerate(self.data)
-                if i % self.sample == 0
-            ]
-        elif isinstance(data[0], dict):
+        if float(self.sample).is_integer():
+            step = int(self.sample)
+            if isinstance(data, list):
+                return data[::step]
+            return islice(data, 0, None, step)
+        return (g for i, g in enumerate(data) if i % self.sample == 0)
+
+    def __convert(self, data: Iterable) -> List[Graph]:
+        """
+        Convert incoming data (list or lazy iterable, e.g. from load_pickle_gz) to correct List[Graph] format
+        """
+        data = iter(self.__sample_data(data))
+        first = next(data, None)
+        if first is None:
+            return []
+        data = chain([first], data)
+
+        if isinstance(first, Graph):
+            return list(data)
+        elif isinstance(first, DefaultGraphFrame):
+            return [g.to_spektral_graph() for g in data]
+        elif isinstance(first, dict):
             return [
-                Graph(x=g["x"], a=g["a"], e=g["e"], y=g["y"], id=g["id"])
-                for i, g in enumerate(data)
-                if i % self.sample == 0
+                Graph(x=g["x"], a=g["a"], e=g["e"], y=g["y"], id=g["id"]) for g in data
             ]
         else:
             raise NotImplementedError()
@@ -228,7 +291,10 @@ class CustomSpektralDataset(Dataset, Sequence):
         else:
             # if we do use the graph_ids we randomly assign all items of a certain graph_id to either
             # val, test or train. We start with validation, because it's assumed to be the smallest dataset.
-            graph_ids = np.asarray([g.get("id")[0] for g in self])
+            # collect the indices of every graph_id in a single pass
+            idxs_by_graph_id = defaultdict(list)
+            for idx, g in enumerate(self):
+                idxs_by_graph_id[g.get("id")].append(idx)
 
             if random_seed:
                 np.random.seed(random_seed)
@@ -240,8 +306,7 @@ class CustomSpektralDataset(Dataset, Sequence):
             def __handle_graph_id(i):
                 graph_id = unique_graph_ids_list[i]
                 unique_graph_ids.remove(graph_id)
-                graph_idxs = np.where(graph_ids == graph_id)[0]
-                return graph_idxs
+                return idxs_by_graph_id[graph_id]
 
             i = 0
             if num_validation > 0:
@@ -255,8 +320,14 @@ class CustomSpektralDataset(Dataset, Sequence):
                 test_idxs.extend(graph_idxs)
                 i += 1
 
-            train_idxs = np.isin(graph_ids, np.asarray(list(unique_graph_ids)))
-            train_idxs = np.where(train_idxs)[0]
+            train_idxs = np.sort(
+                np.fromiter(
+                    chain.from_iterable(
+                        idxs_by_graph_id[graph_id] for graph_id in unique_graph_ids
+                    ),
+                    dtype=np.int64,
+                )
+            )
 
             if validation_idxs:
                 return self[train_idxs], self[test_idxs], self[validation_idxs]